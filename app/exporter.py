@@ -0,0 +1,276 @@
+import datetime
+import glob
+import json
+import os
+import shutil
+
+import numpy as np
+from sqlalchemy import or_, select
+
+from . import models
+import config
+
+# pyarrow es opcional: si no está instalado se exporta a NPZ comprimido
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Nombre del archivo que guarda el progreso de la exportación
+STATE_FILENAME = "_export_state.json"
+
+def _empty_state():
+    """Estado inicial: último ID exportado por tabla y sesiones exportadas aún abiertas."""
+    return {"sessions": 0, "events": 0, "open_sessions": []}
+
+class DataExporter:
+    """
+    Exporta las tablas `sessions` y `events` a archivos columnares comprimidos.
+
+    Las filas se leen por bloques paginados por ID (SQLAlchemy Core, sin
+    construir objetos ORM) y se escriben particionadas por fecha y sesión con
+    directorios `clave=valor`, legibles como dataset con pyarrow. Cada
+    ejecución solo exporta las filas con ID mayor al último exportado,
+    además de las sesiones que seguían abiertas en la exportación anterior.
+    """
+
+    def __init__(self, output_dir=config.EXPORT_DIR, file_format=None,
+                 chunk_size=config.EXPORT_CHUNK_SIZE, engine=None):
+        """Configura el directorio de salida, el formato, el tamaño de bloque y la base de datos."""
+        if file_format is None:
+            file_format = "parquet" if pq is not None else "npz"
+        if file_format not in ("parquet", "npz"):
+            raise ValueError(f"Formato de exportación no soportado: {file_format}")
+        if file_format == "parquet" and pq is None:
+            raise ImportError("Se necesita pyarrow para exportar en formato Parquet.")
+
+        self.output_dir = output_dir
+        self.file_format = file_format
+        self.chunk_size = chunk_size
+        self.engine = engine if engine is not None else models.engine
+
+    def _load_state(self, output_dir):
+        """Lee el progreso de la última exportación (vacío si no hay exportaciones previas)."""
+        state = _empty_state()
+        state_path = os.path.join(output_dir, STATE_FILENAME)
+        if os.path.exists(state_path):
+            with open(state_path, "r", encoding="utf-8") as f:
+                state.update(json.load(f))
+        return state
+
+    def _save_state(self, output_dir, state):
+        """Guarda el estado de forma atómica para no corromperlo si se interrumpe."""
+        state_path = os.path.join(output_dir, STATE_FILENAME)
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+
+    def export(self, incremental=True):
+        """
+        Exporta ambas tablas y devuelve el número de filas escritas por tabla.
+
+        Args:
+            incremental (bool): Si es False se regenera toda la exportación en un
+                directorio temporal que reemplaza al anterior al terminar.
+
+        Returns:
+            dict: Filas exportadas, p. ej. {"sessions": 3, "events": 120}.
+        """
+        if incremental:
+            return self._export_into(self.output_dir)
+
+        # Exportación completa: se escribe aparte y se intercambia al final para
+        # no mezclar archivos nuevos con los de ejecuciones anteriores.
+        staging_dir = self.output_dir.rstrip(os.sep) + ".tmp"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        exported = self._export_into(staging_dir)
+
+        old_dir = self.output_dir.rstrip(os.sep) + ".old"
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if os.path.exists(self.output_dir):
+            os.replace(self.output_dir, old_dir)
+        os.replace(staging_dir, self.output_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+        return exported
+
+    def _export_into(self, output_dir):
+        """Exporta las filas pendientes según el estado guardado en `output_dir`."""
+        os.makedirs(output_dir, exist_ok=True)
+        state = self._load_state(output_dir)
+        return {
+            "sessions": self._export_sessions(output_dir, state),
+            "events": self._export_events(output_dir, state),
+        }
+
+    def _export_sessions(self, output_dir, state):
+        """
+        Exporta las sesiones nuevas y vuelve a exportar las que estaban abiertas.
+
+        Las sesiones sin `end_time` se escriben cada una en su propio archivo
+        `open-<id>`, que se borra cuando la sesión se vuelve a exportar. Las
+        sesiones terminadas van a archivos `part-<primero>-<último>` definitivos.
+        """
+        table = models.Session.__table__
+        previously_open = set(state["open_sessions"])
+        condition = table.c.id > state["sessions"]
+        if previously_open:
+            condition = or_(condition, table.c.id.in_(previously_open))
+
+        total_rows = 0
+        still_open = []
+        returned = set()
+        for rows in self._chunks(table, condition):
+            closed_rows = []
+            for row in rows:
+                returned.add(row.id)
+                if row.id in previously_open:
+                    old_path = self._file_path(output_dir, table.name,
+                                               self._day(row.start_time), None, f"open-{row.id}")
+                    if os.path.exists(old_path):
+                        os.remove(old_path)
+
+                if row.end_time is None:
+                    still_open.append(row.id)
+                    self._write_partitions(output_dir, table, [row], "start_time", None,
+                                           prefix="open")
+                else:
+                    closed_rows.append(row)
+
+            if closed_rows:
+                self._write_partitions(output_dir, table, closed_rows, "start_time", None)
+            total_rows += len(rows)
+
+            # Se guarda el progreso tras cada bloque para poder reanudar
+            last_id = rows[-1].id
+            state["sessions"] = max(state["sessions"], last_id)
+            state["open_sessions"] = sorted(
+                still_open + [i for i in previously_open if i > last_id]
+            )
+            self._save_state(output_dir, state)
+
+        # Sesiones abiertas que ya no existen en la base de datos: se borra su archivo
+        missing = previously_open - returned
+        if missing:
+            for session_id in missing:
+                pattern = os.path.join(output_dir, table.name, "date=*",
+                                       f"open-{session_id}.{self.file_format}")
+                for path in glob.glob(pattern):
+                    os.remove(path)
+            state["open_sessions"] = sorted(set(state["open_sessions"]) - missing)
+            self._save_state(output_dir, state)
+
+        return total_rows
+
+    def _export_events(self, output_dir, state):
+        """Exporta los eventos nuevos; los eventos no cambian una vez escritos."""
+        table = models.Event.__table__
+
+        total_rows = 0
+        for rows in self._chunks(table, table.c.id > state["events"]):
+            self._write_partitions(output_dir, table, rows, "timestamp", "session_id")
+            total_rows += len(rows)
+
+            state["events"] = rows[-1].id
+            self._save_state(output_dir, state)
+
+        return total_rows
+
+    def _chunks(self, table, condition):
+        """
+        Devuelve bloques de filas que cumplen `condition`, ordenados por ID.
+
+        Cada bloque se pide con `id > último ORDER BY id LIMIT chunk_size` en
+        una conexión propia que se cierra antes de escribir los archivos, para
+        no bloquear en SQLite a los detectores que insertan eventos mientras tanto.
+        """
+        last_id = 0
+        while True:
+            query = (
+                select(*table.c)
+                .where(condition, table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(self.chunk_size)
+            )
+            with self.engine.connect() as conn:
+                rows = conn.execute(query).fetchall()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1].id
+
+    @staticmethod
+    def _day(timestamp):
+        """Fecha usada como partición."""
+        return timestamp.date().isoformat() if timestamp is not None else "sin_fecha"
+
+    @staticmethod
+    def _session(session_id):
+        """Sesión usada como partición."""
+        return str(session_id) if session_id is not None else "sin_sesion"
+
+    def _file_path(self, output_dir, table_name, day, session_id, name):
+        """Ruta de un archivo dentro de su partición de fecha (y de sesión para eventos)."""
+        partition_dir = os.path.join(output_dir, table_name, f"date={day}")
+        if session_id is not None:
+            partition_dir = os.path.join(partition_dir, f"session_id={session_id}")
+        return os.path.join(partition_dir, f"{name}.{self.file_format}")
+
+    def _write_partitions(self, output_dir, table, rows, date_column, session_column, prefix="part"):
+        """
+        Agrupa filas por partición y escribe un archivo por partición.
+
+        La columna de sesión no se guarda en los archivos porque ya está en la
+        ruta (`session_id=N`); al leer el dataset pyarrow la recupera de ahí.
+        """
+        partitions = {}
+        for row in rows:
+            key = (self._day(getattr(row, date_column)),
+                   self._session(getattr(row, session_column)) if session_column else None)
+            partitions.setdefault(key, []).append(row)
+
+        columns = [column for column in table.c if column.name != session_column]
+        for (day, session_id), partition_rows in partitions.items():
+            # El rango de IDs en el nombre evita colisiones entre ejecuciones;
+            # los archivos de sesiones abiertas llevan solo su ID para poder reemplazarlos
+            if prefix == "open":
+                name = f"open-{partition_rows[0].id}"
+            else:
+                name = f"{prefix}-{partition_rows[0].id}-{partition_rows[-1].id}"
+            path = self._file_path(output_dir, table.name, day, session_id, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._write_file(path, columns, partition_rows)
+
+    def _write_file(self, path, columns, rows):
+        """Escribe las filas en formato columnar comprimido."""
+        data = {column.name: [getattr(row, column.name) for row in rows] for column in columns}
+        if self.file_format == "parquet":
+            # El esquema se fija desde la tabla para que columnas vacías
+            # (p. ej. end_time aún nulo) tengan el mismo tipo en todos los archivos
+            schema = pa.schema([(column.name, self._arrow_type(column)) for column in columns])
+            pq.write_table(pa.table(data, schema=schema), path, compression="zstd")
+        else:
+            np.savez_compressed(path, **{column.name: self._to_numpy(column, data[column.name])
+                                         for column in columns})
+
+    @staticmethod
+    def _arrow_type(column):
+        """Devuelve el tipo de Arrow equivalente al tipo de la columna SQL."""
+        python_type = column.type.python_type
+        if python_type is datetime.datetime:
+            return pa.timestamp("us")
+        if python_type is str:
+            return pa.string()
+        return pa.int64()
+
+    @staticmethod
+    def _to_numpy(column, values):
+        """Convierte una columna a un array de NumPy que no requiera pickle al cargarse."""
+        python_type = column.type.python_type
+        if python_type is datetime.datetime:
+            return np.array(values, dtype="datetime64[us]")  # None -> NaT
+        if python_type is str:
+            return np.array([v if v is not None else "" for v in values], dtype=str)
+        return np.array([v if v is not None else -1 for v in values], dtype=np.int64)
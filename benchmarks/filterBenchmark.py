@@ -0,0 +1,261 @@
+"""
+Compara los filtros de utils/signalFilters.py con el procesamiento anterior
+(media móvil sum/len para el EAR, MAR sin filtrar) sobre señales sintéticas
+de EAR y MAR a 30 FPS con ruido y huecos sin cara de 0.1 s, 0.2 s y 0.8 s.
+
+Mide, para cada filtro y señal:
+  - Eventos detectados (parpadeos normales y largos, o bostezos) frente a los reales.
+  - Retardo de detección: tiempo entre que la señal real cruza el umbral y
+    la señal filtrada lo cruza.
+  - Coste de CPU por fotograma.
+
+Los fotogramas sin cara se tratan igual que en BlinkDetector y YawnDetector.
+
+Uso:
+    python -m benchmarks.filterBenchmark
+"""
+import collections
+import math
+import random
+import statistics
+import time
+
+import config
+from utils.signalFilters import FILTERS, create_filter
+
+FPS = 30.0
+SECONDS = 180.0
+
+OPEN_EAR = 0.30
+CLOSED_EAR = 0.08
+EAR_NOISE_STD = 0.01
+EAR_THRESHOLD = OPEN_EAR * config.CLOSED_EYE_RATIO
+
+CLOSED_MAR = 0.05
+SPEECH_MAR = 0.35
+YAWN_MAR = 0.75
+MAR_NOISE_STD = 0.02
+
+class LegacyMovingAverage:
+    """Suavizado anterior del EAR en BlinkDetector: sum(deque) / len(deque) en cada fotograma."""
+
+    def __init__(self):
+        self.ear_history = collections.deque(maxlen=config.SMOOTHING_FRAMES)
+
+    def update(self, value, timestamp):
+        self.ear_history.append(value)
+        return sum(self.ear_history) / len(self.ear_history)
+
+class NoFilter:
+    """Procesamiento anterior del MAR en YawnDetector: el valor crudo."""
+
+    def update(self, value, timestamp):
+        return value
+
+def _pulse(t, start, duration, base, peak):
+    """Evento ideal en forma de coseno entre `base` y `peak`; None fuera del evento."""
+    phase = (t - start) / duration
+    if not 0.0 <= phase <= 1.0:
+        return None
+    return base + (peak - base) * (0.5 - 0.5 * math.cos(2 * math.pi * phase))
+
+def generate_trace(events, base, noise_std, rng):
+    """
+    Genera fotogramas (t, valor_real, valor_ruidoso) a partir de eventos
+    (inicio, duración, pico, tipo). Un valor_ruidoso de None representa un
+    fotograma sin cara. Tras algunos eventos se insertan huecos sin cara y
+    en mitad de otros se pierde la cara durante 0.1 s.
+    """
+    gaps = []
+    for i, (start, duration, _, _) in enumerate(events):
+        if i % 4 == 1:
+            gap = 0.2 if i % 8 == 1 else 0.8
+            gaps.append((start + duration + 0.5, start + duration + 0.5 + gap))
+        elif i % 4 == 3:
+            middle = start + duration / 2
+            gaps.append((middle, middle + 0.1))
+
+    frames = []
+    event_iter = iter(events)
+    current = next(event_iter, None)
+    for i in range(int(SECONDS * FPS)):
+        t = i / FPS
+        while current and t > current[0] + current[1]:
+            current = next(event_iter, None)
+        clean = _pulse(t, current[0], current[1], base, current[2]) if current else None
+        if clean is None:
+            clean = base
+        if any(start <= t < end for start, end in gaps):
+            frames.append((t, clean, None))
+        else:
+            frames.append((t, clean, clean + rng.gauss(0.0, noise_std)))
+    return frames
+
+def ear_events(rng):
+    """Mayoría de parpadeos normales (200-400 ms) y algunos largos (somnolencia)."""
+    events = []
+    t = 1.0
+    while t < SECONDS - 4.0:
+        if rng.random() < 0.1:
+            events.append((t, rng.uniform(2.2, 3.0), CLOSED_EAR, "largo"))
+        else:
+            events.append((t, rng.uniform(0.2, 0.4), CLOSED_EAR, "normal"))
+        t += events[-1][1] + rng.uniform(2.0, 4.0)
+    return events
+
+def mar_events(rng):
+    """Bostezos de 3-6 s y aperturas cortas de la boca al hablar, que no deben contarse."""
+    events = []
+    t = 1.0
+    while t < SECONDS - 7.0:
+        if rng.random() < 0.3:
+            events.append((t, rng.uniform(3.0, 6.0), YAWN_MAR, "bostezo"))
+        else:
+            events.append((t, rng.uniform(0.2, 0.5), SPEECH_MAR, "habla"))
+        t += events[-1][1] + rng.uniform(2.0, 4.0)
+    return events
+
+def run_ear(filter_obj, frames, legacy):
+    """
+    Reproduce BlinkDetector.process_frame y _update_blink_counter.
+
+    Returns:
+        tuple: (parpadeos normales, parpadeos largos, instantes de cierre).
+    """
+    normal, long_, onsets = 0, 0, []
+    start = None
+    for t, _, noisy in frames:
+        if noisy is not None:
+            value = filter_obj.update(noisy, t)
+        elif legacy:
+            # Antes: se vaciaba el historial y -1.0 se trataba como ojo cerrado
+            filter_obj.ear_history.clear()
+            value = -1.0
+        else:
+            value = filter_obj.hold(t)
+            if value is None:
+                start = None
+                continue
+
+        if value < EAR_THRESHOLD:
+            if start is None:
+                start = t
+                onsets.append(t)
+        elif start is not None:
+            duration = t - start
+            if duration >= config.LONG_BLINK_DURATION_SECONDS:
+                long_ += 1
+            elif config.MIN_BLINK_DURATION_SECONDS <= duration <= config.MAX_NORMAL_BLINK_DURATION_SECONDS:
+                normal += 1
+            start = None
+    return normal, long_, onsets
+
+def run_mar(filter_obj, frames, legacy):
+    """
+    Reproduce YawnDetector.process_frame y _update_yawn_counter.
+
+    Returns:
+        tuple: (bostezos, instantes de apertura).
+    """
+    yawns, onsets = 0, []
+    start = None
+    for t, _, noisy in frames:
+        if noisy is not None:
+            value = filter_obj.update(noisy, t)
+        elif legacy:
+            # Antes: cualquier fotograma sin cara cancelaba el bostezo en curso
+            start = None
+            continue
+        else:
+            value = filter_obj.hold(t)
+            if value is None:
+                start = None
+                continue
+
+        if value > config.YAWN_THRESHOLD:
+            if start is None:
+                start = t
+                onsets.append(t)
+        elif start is not None:
+            if t - start >= config.MIN_YAWN_DURATION_SECONDS:
+                yawns += 1
+            start = None
+    return yawns, onsets
+
+def _clean(frames):
+    """Fotogramas con la señal real, sin ruido y sin huecos, para medir los cruces de referencia."""
+    return [(t, clean, clean) for t, clean, _ in frames]
+
+def _onset_lags(reference_onsets, onsets):
+    """Retardo entre cada cruce real del umbral y el primer cruce filtrado posterior."""
+    lags = []
+    for ref in reference_onsets:
+        later = [t for t in onsets if ref - 0.05 <= t <= ref + 0.5]
+        if later:
+            lags.append(max(later[0] - ref, 0.0))
+    return lags
+
+def time_per_update(factory, frames, repeats=20):
+    """Microsegundos por llamada a update(), sin contar los fotogramas sin cara."""
+    filter_obj = factory()
+    samples = [(t, noisy) for t, _, noisy in frames if noisy is not None]
+    start = time.perf_counter()
+    for r in range(repeats):
+        offset = r * (samples[-1][0] + 1.0)
+        for t, value in samples:
+            filter_obj.update(value, t + offset)
+    return (time.perf_counter() - start) / (repeats * len(samples)) * 1e6
+
+def _format_lags(lags):
+    if not lags:
+        return f"{'-':>12}{'-':>12}"
+    return f"{statistics.mean(lags) * 1000:>9.1f} ms{max(lags) * 1000:>9.1f} ms"
+
+def benchmark_ear(rng):
+    events = ear_events(rng)
+    frames = generate_trace(events, OPEN_EAR, EAR_NOISE_STD, rng)
+    real_normal = sum(1 for e in events if e[3] == "normal")
+    real_long = sum(1 for e in events if e[3] == "largo")
+    _, _, reference = run_ear(NoFilter(), _clean(frames), False)
+
+    print(f"EAR: umbral {EAR_THRESHOLD:.3f}, ruido {EAR_NOISE_STD}, "
+          f"reales {real_normal} normales / {real_long} largos")
+    print(f"{'filtro':<20}{'normales':>10}{'largos':>8}{'retardo medio':>14}"
+          f"{'retardo máx':>12}{'µs/fotograma':>14}")
+
+    candidates = [("anterior (sum/len)", LegacyMovingAverage, True)]
+    candidates += [(name, lambda name=name: create_filter(name, "ear"), False) for name in FILTERS]
+    for name, factory, legacy in candidates:
+        normal, long_, onsets = run_ear(factory(), frames, legacy)
+        lags = _onset_lags(reference, onsets)
+        print(f"{name:<20}{normal:>10}{long_:>8}{_format_lags(lags)}"
+              f"{time_per_update(factory, frames):>14.2f}")
+
+def benchmark_mar(rng):
+    events = mar_events(rng)
+    frames = generate_trace(events, CLOSED_MAR, MAR_NOISE_STD, rng)
+    real_yawns = sum(1 for e in events if e[3] == "bostezo")
+    _, reference = run_mar(NoFilter(), _clean(frames), False)
+
+    print(f"MAR: umbral {config.YAWN_THRESHOLD}, ruido {MAR_NOISE_STD}, "
+          f"reales {real_yawns} bostezos")
+    print(f"{'filtro':<20}{'bostezos':>10}{'':>8}{'retardo medio':>14}"
+          f"{'retardo máx':>12}{'µs/fotograma':>14}")
+
+    candidates = [("anterior (crudo)", NoFilter, True)]
+    candidates += [(name, lambda name=name: create_filter(name, "mar"), False) for name in FILTERS]
+    for name, factory, legacy in candidates:
+        yawns, onsets = run_mar(factory(), frames, legacy)
+        lags = _onset_lags(reference, onsets)
+        print(f"{name:<20}{yawns:>10}{'':>8}{_format_lags(lags)}"
+              f"{time_per_update(factory, frames):>14.2f}")
+
+def main():
+    rng = random.Random(0)
+    print(f"{SECONDS:.0f} s a {FPS:.0f} FPS con huecos sin cara de 0.1 s, 0.2 s y 0.8 s\n")
+    benchmark_ear(rng)
+    print()
+    benchmark_mar(rng)
+
+if __name__ == '__main__':
+    main()
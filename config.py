@@ -98,10 +98,37 @@ YAWN_ALERT_TIME_WINDOW = 60  # Duración de la ventana de tiempo en segundos (ej
 YAWN_ALERT_THRESHOLD = 3      # Número de bostezos en la ventana de tiempo para activar la alerta
 YAWN_ALERT_WINDOW_SIZE = YAWN_ALERT_THRESHOLD + 2 # Se recomienda que la cola sea un poco más grande que el umbral
 
-# Ventana de tiempo para el suavizado del EAR (en número de fotogramas)
+# --- Filtro de señal para el EAR y el MAR (ver utils/signalFilters.py) ---
+# Opciones: "one_euro", "exponential", "moving_average"
+# Para el EAR "exponential" detecta los mismos parpadeos que "one_euro" con
+# un retardo similar y cerca de la mitad de CPU (benchmarks/filterBenchmark.py).
+# Para el MAR "one_euro" tiene bastante menos retardo que "exponential".
+EAR_SIGNAL_FILTER = "exponential"
+MAR_SIGNAL_FILTER = "one_euro"
+# Frecuencia de corte mínima (Hz): menor valor = más suavizado con la señal estable
+EAR_ONE_EURO_MIN_CUTOFF = 1.0
+# Aumento de la frecuencia de corte con la velocidad de la señal: mayor valor = menos retardo
+EAR_ONE_EURO_BETA = 5.0
+# El MAR tiene mayor rango y los bostezos duran más de un segundo: se puede suavizar más
+MAR_ONE_EURO_MIN_CUTOFF = 0.5
+MAR_ONE_EURO_BETA = 1.0
+# Frecuencia de corte (Hz) para suavizar la derivada
+ONE_EURO_D_CUTOFF = 1.0
+# Constante de tiempo (en segundos) del filtro "exponential"
+EAR_EMA_TAU_SECONDS = 0.05
+MAR_EMA_TAU_SECONDS = 0.15
+# Huecos sin cara de hasta este tiempo (en segundos) mantienen el último valor filtrado;
+# los más largos reinician el filtro y el parpadeo o bostezo en curso
+FILTER_MAX_GAP_SECONDS = 0.5
+
+# Ventana de tiempo para el suavizado del EAR con "moving_average" (en número de fotogramas)
 SMOOTHING_FRAMES = 8 
 
 # --- Configuración para la calibración del umbral adaptativo ---
 CALIBRATION_DURATION_SECONDS = 5.0 # Duración de la fase de calibración
 CLOSED_EYE_RATIO = 0.70            # Porcentaje del EAR de ojos abiertos para definir el umbral de cierre
-DROWSY_RATIO = 0.50                # Porcentaje del EAR de ojos abiertos para una alerta de somnolencia
\ No newline at end of file
+DROWSY_RATIO = 0.50                # Porcentaje del EAR de ojos abiertos para una alerta de somnolencia
+
+# --- Exportación de datos ---
+EXPORT_DIR = "exports"       # Directorio donde se escriben los archivos exportados
+EXPORT_CHUNK_SIZE = 5000     # Número de filas leídas de la base de datos por bloque
@@ -0,0 +1,26 @@
+import argparse
+
+from app.exporter import DataExporter
+import config
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Exporta las sesiones y eventos de la base de datos a archivos columnares."
+    )
+    parser.add_argument("--output", default=config.EXPORT_DIR,
+                        help="Directorio de salida de los archivos exportados.")
+    parser.add_argument("--format", choices=["parquet", "npz"], default=None,
+                        help="Formato de salida (por defecto Parquet si pyarrow está instalado).")
+    parser.add_argument("--chunk-size", type=int, default=config.EXPORT_CHUNK_SIZE,
+                        help="Número de filas leídas por bloque.")
+    parser.add_argument("--full", action="store_true",
+                        help="Regenera toda la exportación y reemplaza la anterior.")
+    args = parser.parse_args()
+
+    exporter = DataExporter(args.output, args.format, args.chunk_size)
+    exported = exporter.export(incremental=not args.full)
+    print(f"Exportación finalizada en '{args.output}' ({exporter.file_format}): "
+          f"{exported['sessions']} sesiones, {exported['events']} eventos.")
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,9 @@
 import cv2
 import mediapipe as mp
 import time
-import collections
 
 from utils.earDetector import calculate_ear
+from utils.signalFilters import create_filter
 import config
 from app.controllers import DataController
 
@@ -26,8 +26,8 @@ class BlinkDetector:
         self.is_eye_closed = False
         self.data_controller = data_controller
 
-        # --- Variables para el suavizado del EAR (Media Móvil) ---
-        self.ear_history = collections.deque(maxlen=config.SMOOTHING_FRAMES)
+        # --- Variables para el filtrado del EAR (ver utils/signalFilters.py) ---
+        self.ear_filter = create_filter()
         self.smoothed_ear = -1.0
 
         # --- Variables para el umbral adaptativo ---
@@ -121,20 +121,26 @@ class BlinkDetector:
             except IndexError:
                 avg_ear = -1.0
         
-        # Lógica de suavizado del EAR
+        # Lógica de filtrado del EAR. En huecos cortos sin cara se mantiene el
+        # último valor filtrado; en huecos más largos el valor queda en -1.0.
+        now = time.monotonic()
         if avg_ear >= 0.0:
-            self.ear_history.append(avg_ear)
-            self.smoothed_ear = sum(self.ear_history) / len(self.ear_history)
+            self.smoothed_ear = self.ear_filter.update(avg_ear, now)
         else:
-            self.ear_history.clear()
-            self.smoothed_ear = -1.0
+            held_ear = self.ear_filter.hold(now)
+            self.smoothed_ear = held_ear if held_ear is not None else -1.0
 
         # Lógica de calibración o detección
         if self.is_calibrating:
-            if self.smoothed_ear >= 0.0:
+            if avg_ear >= 0.0:
                 self._calibrate_threshold(self.smoothed_ear)
-        else:
+        elif self.smoothed_ear >= 0.0:
             self._update_blink_counter(self.smoothed_ear)
+        else:
+            # Sin cara durante más de FILTER_MAX_GAP_SECONDS: la ausencia de cara
+            # no cuenta como ojo cerrado y se descarta el parpadeo en curso
+            self.is_eye_closed = False
+            self.blink_start_time = None
         
         # Dibujado de landmarks, info y alertas
         if results.multi_face_landmarks:
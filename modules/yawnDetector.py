@@ -4,6 +4,7 @@ import time
 import collections # Se necesita para una cola de tamaño fijo
 
 from utils.marDetector import calculate_mar
+from utils.signalFilters import create_filter
 import config
 from app.controllers import DataController
 from utils.beepAlert import beep_alerta
@@ -23,6 +24,9 @@ class YawnDetector:
         self.detection_reliable = True
         
         self.data_controller = data_controller
+
+        # Filtro de la señal MAR (ver utils/signalFilters.py)
+        self.mar_filter = create_filter(signal="mar")
         
         # --- Nueva lógica para la alarma de bostezos ---
         self.yawn_timestamps = collections.deque(maxlen=config.YAWN_ALERT_WINDOW_SIZE)
@@ -91,7 +95,8 @@ class YawnDetector:
             required_indices = set(config.MOUTH_INDEXES_FOR_MAR_CALC)
             if len(face_landmarks) > max(required_indices) if required_indices else 0:
                 try:
-                    mar_value = calculate_mar(face_landmarks, (height, width))
+                    raw_mar = calculate_mar(face_landmarks, (height, width))
+                    mar_value = self.mar_filter.update(raw_mar, time.monotonic())
                     self._update_yawn_counter(mar_value)
 
                     mouth_points_to_draw = [face_landmarks[i] for i in config.MOUTH_INDEXES]
@@ -100,14 +105,21 @@ class YawnDetector:
 
                 except Exception as e:
                     print(f"Error al calcular MAR: {e}")
-                    self.yawn_start_time = None
                     self.detection_reliable = False
             else:
-                self.yawn_start_time = None
                 self.detection_reliable = False
         else:
-            self.yawn_start_time = None
             self.detection_reliable = False
+
+        if not self.detection_reliable:
+            # En huecos cortos sin boca visible se mantiene el último MAR filtrado;
+            # en huecos más largos se descarta el bostezo en curso
+            held_mar = self.mar_filter.hold(time.monotonic())
+            if held_mar is not None:
+                mar_value = held_mar
+                self._update_yawn_counter(mar_value)
+            else:
+                self.yawn_start_time = None
             
         self._draw_info(frame, mar_value)
         
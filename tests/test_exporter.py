@@ -0,0 +1,162 @@
+import datetime
+import glob
+import json
+import os
+import sqlite3
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    """Base de datos SQLite temporal y un exportador NPZ que escribe en tmp_path."""
+    # app.models crea database.db en el directorio actual al importarse
+    monkeypatch.chdir(tmp_path)
+    from app import models
+    from app.exporter import DataExporter
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    models.Base.metadata.create_all(engine)
+    output_dir = str(tmp_path / "exports")
+    exporter = DataExporter(output_dir, "npz", chunk_size=2, engine=engine)
+    return engine, models, exporter, output_dir
+
+def _add_session(engine, models, end_time=None):
+    with engine.begin() as conn:
+        result = conn.execute(models.Session.__table__.insert().values(
+            start_time=datetime.datetime(2026, 1, 1, 8, 0), end_time=end_time))
+        return result.inserted_primary_key[0]
+
+def _add_events(engine, models, session_id, count):
+    with engine.begin() as conn:
+        for i in range(count):
+            conn.execute(models.Event.__table__.insert().values(
+                timestamp=datetime.datetime(2026, 1, 1, 8, i),
+                event_type="bostezo", description=f"e{i}", session_id=session_id))
+
+def _close_session(engine, models, session_id):
+    table = models.Session.__table__
+    with engine.begin() as conn:
+        conn.execute(table.update().where(table.c.id == session_id)
+                     .values(end_time=datetime.datetime(2026, 1, 1, 9, 0)))
+
+def _read(output_dir, table_name):
+    """Lee todas las filas exportadas de una tabla como {id: end_time o None}."""
+    rows = {}
+    for path in glob.glob(os.path.join(output_dir, table_name, "**", "*.npz"), recursive=True):
+        with np.load(path) as data:
+            for i, row_id in enumerate(data["id"]):
+                assert int(row_id) not in rows, f"fila {row_id} duplicada"
+                end_time = data["end_time"][i] if "end_time" in data else None
+                rows[int(row_id)] = None if end_time is None or np.isnat(end_time) else end_time
+    return rows
+
+def _state(output_dir):
+    with open(os.path.join(output_dir, "_export_state.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+def test_incremental_and_full_export(env):
+    engine, models, exporter, output_dir = env
+
+    first = _add_session(engine, models, end_time=datetime.datetime(2026, 1, 1, 8, 30))
+    second = _add_session(engine, models)
+    _add_events(engine, models, first, 3)
+    _add_events(engine, models, second, 2)
+
+    assert exporter.export() == {"sessions": 2, "events": 5}
+    assert _state(output_dir) == {"sessions": 2, "events": 5, "open_sessions": [second]}
+    assert _read(output_dir, "sessions")[second] is None
+
+    # Sin filas nuevas solo se vuelve a exportar la sesión abierta
+    assert exporter.export() == {"sessions": 1, "events": 0}
+
+    # La sesión abierta se cierra y se añaden filas nuevas
+    _close_session(engine, models, second)
+    third = _add_session(engine, models)
+    _add_events(engine, models, third, 4)
+
+    assert exporter.export() == {"sessions": 2, "events": 4}
+    assert _state(output_dir) == {"sessions": 3, "events": 9, "open_sessions": [third]}
+    sessions = _read(output_dir, "sessions")
+    assert sorted(sessions) == [first, second, third]
+    assert sessions[second] is not None
+    assert len(_read(output_dir, "events")) == 9
+
+    # La exportación completa reemplaza la anterior sin duplicar filas
+    assert exporter.export(incremental=False) == {"sessions": 3, "events": 9}
+    assert _state(output_dir) == {"sessions": 3, "events": 9, "open_sessions": [third]}
+    assert sorted(_read(output_dir, "sessions")) == [first, second, third]
+    assert len(_read(output_dir, "events")) == 9
+    assert not os.path.exists(output_dir + ".tmp")
+    assert not os.path.exists(output_dir + ".old")
+
+def test_missing_open_session_is_removed(env):
+    engine, models, exporter, output_dir = env
+
+    closed = _add_session(engine, models, end_time=datetime.datetime(2026, 1, 1, 8, 30))
+    opened = _add_session(engine, models)
+    exporter.export()
+    assert sorted(_read(output_dir, "sessions")) == [closed, opened]
+
+    table = models.Session.__table__
+    with engine.begin() as conn:
+        conn.execute(table.delete().where(table.c.id == opened))
+
+    assert exporter.export() == {"sessions": 0, "events": 0}
+    assert _state(output_dir)["open_sessions"] == []
+    assert sorted(_read(output_dir, "sessions")) == [closed]
+
+def test_writes_are_not_blocked_during_export(env, tmp_path):
+    engine, models, exporter, output_dir = env
+    session_id = _add_session(engine, models)
+    _add_events(engine, models, session_id, 6)
+
+    # Entre dos bloques de eventos, otra conexión (como la de main.py) inserta un evento
+    write_file = exporter._write_file
+    inserted = []
+
+    def write_and_insert(path, columns, rows):
+        write_file(path, columns, rows)
+        if inserted or "events" not in path:
+            return
+        conn = sqlite3.connect(tmp_path / "test.db", timeout=1)
+        try:
+            conn.execute("INSERT INTO events (timestamp, event_type, description, session_id) "
+                         "VALUES ('2026-01-01 08:30:00', 'bostezo', 'concurrente', ?)",
+                         (session_id,))
+            conn.commit()
+            inserted.append(True)
+        finally:
+            conn.close()
+
+    exporter._write_file = write_and_insert
+    exporter.export()
+    exporter.export()
+
+    with engine.connect() as conn:
+        total_events = conn.execute(sqlalchemy.text("SELECT COUNT(*) FROM events")).scalar()
+    assert inserted
+    assert len(_read(output_dir, "events")) == total_events
+
+def test_parquet_export_reads_back_as_dataset(env):
+    pq = pytest.importorskip("pyarrow.parquet")
+    engine, models, _, output_dir = env
+    from app.exporter import DataExporter
+
+    first = _add_session(engine, models, end_time=datetime.datetime(2026, 1, 1, 8, 30))
+    second = _add_session(engine, models)
+    _add_events(engine, models, first, 3)
+    _add_events(engine, models, second, 2)
+    _add_events(engine, models, None, 1)
+
+    DataExporter(output_dir, "parquet", chunk_size=2, engine=engine).export()
+
+    sessions = pq.read_table(os.path.join(output_dir, "sessions"))
+    assert sorted(sessions.column("id").to_pylist()) == [first, second]
+
+    events = pq.read_table(os.path.join(output_dir, "events"))
+    assert events.num_rows == 6
+    session_ids = [str(v) for v in events.column("session_id").to_pylist()]
+    assert sorted(session_ids) == sorted([str(first)] * 3 + [str(second)] * 2 + ["sin_sesion"])
@@ -0,0 +1,88 @@
+import collections
+import random
+
+import pytest
+
+import config
+from utils.signalFilters import (
+    FILTER_PARAMS,
+    FILTERS,
+    ExponentialFilter,
+    MovingAverageFilter,
+    OneEuroFilter,
+    SignalFilter,
+    create_filter,
+)
+
+def test_update_keeps_state_within_gap_and_resets_beyond():
+    f = ExponentialFilter(tau=0.1, max_gap_seconds=0.5)
+    assert f.update(1.0, 0.0) == 1.0
+    smoothed = f.update(0.0, 0.4)
+    assert 0.0 < smoothed < 1.0
+
+    # Hueco más largo que max_gap_seconds: se reinicia con la nueva muestra
+    assert f.update(5.0, 1.0) == 5.0
+
+def test_hold_returns_last_value_only_within_gap():
+    f = ExponentialFilter(tau=0.1, max_gap_seconds=0.5)
+    assert f.hold(0.0) is None
+
+    value = f.update(0.3, 0.0)
+    assert f.hold(0.2) == value
+    assert f.hold(0.5) == value
+    assert f.hold(0.6) is None
+
+    # hold() no cuenta como muestra: el hueco se sigue midiendo desde la última
+    assert f.update(0.1, 0.7) == 0.1
+
+def test_resets_when_time_goes_backwards():
+    f = OneEuroFilter(min_cutoff=1.0, beta=5.0, d_cutoff=1.0)
+    f.update(0.3, 10.0)
+    f.update(0.3, 10.033)
+    assert f.hold(9.0) is None
+    assert f.update(0.1, 9.0) == 0.1
+    assert f.derivative == 0.0
+
+def test_moving_average_matches_sum_over_window():
+    rng = random.Random(0)
+    window = 8
+    f = MovingAverageFilter(window=window)
+    history = collections.deque(maxlen=window)
+    for i in range(50):
+        value = rng.uniform(0.0, 0.4)
+        history.append(value)
+        assert f.update(value, i / 30.0) == pytest.approx(sum(history) / len(history))
+
+def test_exponential_weight_does_not_depend_on_frame_rate():
+    slow = ExponentialFilter(tau=0.1)
+    fast = ExponentialFilter(tau=0.1)
+    slow.update(0.0, 0.0)
+    fast.update(0.0, 0.0)
+    slow.update(1.0, 0.2)
+    fast.update(1.0, 0.1)
+    assert fast.update(1.0, 0.2) == pytest.approx(slow.value)
+
+def test_incomplete_subclass_fails_on_creation():
+    class NoStep(SignalFilter):
+        pass
+
+    with pytest.raises(TypeError):
+        NoStep()
+
+def test_create_filter_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        create_filter("kalman")
+
+def test_create_filter_applies_per_signal_params():
+    ear = create_filter("one_euro", "ear")
+    mar = create_filter("one_euro", "mar")
+    assert ear.beta == FILTER_PARAMS["ear"]["one_euro"]["beta"]
+    assert mar.beta == FILTER_PARAMS["mar"]["one_euro"]["beta"]
+    assert mar.min_cutoff == config.MAR_ONE_EURO_MIN_CUTOFF
+
+    assert create_filter("exponential", "mar").tau == config.MAR_EMA_TAU_SECONDS
+    assert create_filter("one_euro", "mar", beta=3.0).beta == 3.0
+
+def test_create_filter_uses_default_filter_per_signal():
+    assert type(create_filter(signal="ear")) is FILTERS[config.EAR_SIGNAL_FILTER]
+    assert type(create_filter(signal="mar")) is FILTERS[config.MAR_SIGNAL_FILTER]
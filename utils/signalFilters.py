@@ -0,0 +1,191 @@
+import abc
+import collections
+import math
+
+import config
+
+class SignalFilter(abc.ABC):
+    """
+    Clase base para los filtros de señal (EAR, MAR) aplicados fotograma a fotograma.
+
+    Cada filtro guarda un estado de tamaño fijo y se actualiza en O(1).
+    Si entre dos muestras pasa más de `max_gap_seconds` (p. ej. la cara se
+    perdió durante un tiempo) el filtro se reinicia con la nueva muestra;
+    los huecos más cortos se atraviesan sin perder el estado.
+
+    Las marcas de tiempo deben venir de un reloj monótono (time.monotonic()).
+    """
+
+    def __init__(self, max_gap_seconds=config.FILTER_MAX_GAP_SECONDS):
+        self.max_gap_seconds = max_gap_seconds
+        self.last_time = None
+        self.value = None
+
+    def update(self, value, timestamp):
+        """
+        Añade una muestra y devuelve el valor filtrado.
+
+        Args:
+            value (float): Valor crudo de la señal.
+            timestamp (float): Instante de la muestra en segundos (time.monotonic()).
+
+        Returns:
+            float: El valor filtrado.
+        """
+        if not self._within_gap(timestamp):
+            self.reset()
+            self._seed(value)
+        else:
+            # Se evita dt = 0 si dos fotogramas llegan con la misma marca de tiempo
+            dt = max(timestamp - self.last_time, 1e-6)
+            self._step(value, dt)
+        self.last_time = timestamp
+        return self.value
+
+    def hold(self, timestamp):
+        """
+        Valor a usar en un fotograma sin muestra (p. ej. sin cara detectada).
+
+        Returns:
+            float: El último valor filtrado si el hueco no supera `max_gap_seconds`,
+            o None si es más largo (el filtro se reinicia con la próxima muestra).
+        """
+        return self.value if self._within_gap(timestamp) else None
+
+    def reset(self):
+        """Descarta el estado del filtro."""
+        self.last_time = None
+        self.value = None
+
+    def _within_gap(self, timestamp):
+        """Indica si hay estado previo y `timestamp` no está a más de `max_gap_seconds` de él."""
+        if self.last_time is None:
+            return False
+        return 0.0 <= timestamp - self.last_time <= self.max_gap_seconds
+
+    def _seed(self, value):
+        """Inicializa el estado con la primera muestra."""
+        self.value = value
+
+    @abc.abstractmethod
+    def _step(self, value, dt):
+        """Actualiza el estado con una nueva muestra separada `dt` segundos de la anterior."""
+
+class MovingAverageFilter(SignalFilter):
+    """
+    Media móvil de los últimos `window` valores, con suma acumulada para ser O(1).
+    La ventana se mide en fotogramas, por lo que no tiene en cuenta `dt`.
+    """
+
+    def __init__(self, window=config.SMOOTHING_FRAMES, **kwargs):
+        super().__init__(**kwargs)
+        self.history = collections.deque(maxlen=window)
+        self.total = 0.0
+
+    def reset(self):
+        super().reset()
+        self.history.clear()
+        self.total = 0.0
+
+    def _seed(self, value):
+        self._step(value, None)
+
+    def _step(self, value, dt):
+        if len(self.history) == self.history.maxlen:
+            self.total -= self.history[0]
+        self.history.append(value)
+        self.total += value
+        self.value = self.total / len(self.history)
+
+class ExponentialFilter(SignalFilter):
+    """
+    Media móvil exponencial con constante de tiempo `tau` (en segundos).
+    El peso de cada muestra se calcula a partir de `dt`, así que el suavizado
+    no depende de los FPS.
+    """
+
+    def __init__(self, tau=config.EAR_EMA_TAU_SECONDS, **kwargs):
+        super().__init__(**kwargs)
+        self.tau = tau
+
+    def _step(self, value, dt):
+        alpha = 1.0 - math.exp(-dt / self.tau)
+        self.value += alpha * (value - self.value)
+
+class OneEuroFilter(SignalFilter):
+    """
+    Filtro One Euro (Casiez et al., 2012): un paso bajo cuya frecuencia de corte
+    aumenta con la velocidad de la señal. Suaviza el ruido con los ojos quietos
+    y sigue casi sin retardo los cambios rápidos como un parpadeo.
+    """
+
+    def __init__(self, min_cutoff=config.EAR_ONE_EURO_MIN_CUTOFF, beta=config.EAR_ONE_EURO_BETA,
+                 d_cutoff=config.ONE_EURO_D_CUTOFF, **kwargs):
+        super().__init__(**kwargs)
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.derivative = 0.0
+
+    def reset(self):
+        super().reset()
+        self.derivative = 0.0
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        """Factor de suavizado de un paso bajo de primer orden con frecuencia `cutoff` (Hz)."""
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def _step(self, value, dt):
+        # Derivada suavizada de la señal, usada para adaptar la frecuencia de corte
+        raw_derivative = (value - self.value) / dt
+        self.derivative += self._alpha(self.d_cutoff, dt) * (raw_derivative - self.derivative)
+
+        cutoff = self.min_cutoff + self.beta * abs(self.derivative)
+        self.value += self._alpha(cutoff, dt) * (value - self.value)
+
+# Filtros disponibles para config.EAR_SIGNAL_FILTER y config.MAR_SIGNAL_FILTER
+FILTERS = {
+    "moving_average": MovingAverageFilter,
+    "exponential": ExponentialFilter,
+    "one_euro": OneEuroFilter,
+}
+
+# Filtro por defecto y parámetros de cada filtro según la señal, ya que el
+# EAR y el MAR tienen rangos y duraciones de evento distintos
+DEFAULT_FILTERS = {
+    "ear": config.EAR_SIGNAL_FILTER,
+    "mar": config.MAR_SIGNAL_FILTER,
+}
+
+FILTER_PARAMS = {
+    "ear": {
+        "moving_average": {"window": config.SMOOTHING_FRAMES},
+        "exponential": {"tau": config.EAR_EMA_TAU_SECONDS},
+        "one_euro": {"min_cutoff": config.EAR_ONE_EURO_MIN_CUTOFF, "beta": config.EAR_ONE_EURO_BETA},
+    },
+    "mar": {
+        "moving_average": {"window": config.SMOOTHING_FRAMES},
+        "exponential": {"tau": config.MAR_EMA_TAU_SECONDS},
+        "one_euro": {"min_cutoff": config.MAR_ONE_EURO_MIN_CUTOFF, "beta": config.MAR_ONE_EURO_BETA},
+    },
+}
+
+def create_filter(name=None, signal="ear", **kwargs):
+    """
+    Crea un filtro de señal a partir de su nombre.
+
+    Args:
+        name (str): Clave de FILTERS. Por defecto el de DEFAULT_FILTERS para `signal`.
+        signal (str): "ear" o "mar"; selecciona los parámetros de FILTER_PARAMS.
+        **kwargs: Parámetros que reemplazan a los de FILTER_PARAMS.
+
+    Returns:
+        SignalFilter: Una instancia nueva del filtro.
+    """
+    name = name or DEFAULT_FILTERS[signal]
+    if name not in FILTERS:
+        raise ValueError(f"Filtro de señal desconocido: {name}")
+    params = dict(FILTER_PARAMS[signal][name], **kwargs)
+    return FILTERS[name](**params)